@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from cloudshell.shell.flows.autoload.basic_flow import AbstractAutoloadFlow
@@ -29,15 +30,23 @@ class ServerTechAutoloadFlow(AbstractAutoloadFlow):
         logger.info("*" * 70)
         logger.info("Start discovery process .....")
 
-        outlets_info = self._si.get_outlets_info()
-        pdu_info = self._si.get_pdu_info()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            outlets_future = executor.submit(self._si.get_outlets_info)
+            units_future = executor.submit(self._si.get_pdu_units_info)
+            system_future = executor.submit(self._si.get_pdu_system_info)
+            outlets_info = outlets_future.result()
+            pdu_info = self._si.get_pdu_info(
+                units_info=units_future.result(),
+                system_data=system_future.result(),
+            )
 
         resource_model.vendor = "Server Technology"
         resource_model.model = pdu_info.get("model", "")
 
-        for outlet_id, outlet_state in outlets_info.items():
-            outlet_object = resource_model.entities.PowerSocket(index=outlet_id)
-            resource_model.connect_power_socket(outlet_object)
+        power_socket = resource_model.entities.PowerSocket
+        connect_power_socket = resource_model.connect_power_socket
+        for outlet_id in outlets_info:
+            connect_power_socket(power_socket(index=outlet_id))
 
         autoload_details = resource_model.build()
         logger.info("Discovery process finished successfully")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import TYPE_CHECKING
 
 from attrs import define
@@ -15,11 +16,14 @@ class ServerTechOutletsStateFlow:
     _si: ServerTechHandler
 
     AVAILABLE_STATES = ["on", "off", "reboot"]
+    MAX_WORKERS = 8
 
     @staticmethod
     def _ports_to_outlet_ids(ports: list[str]) -> list[str]:
-        """Convert ports to the suitable format."""
-        return [port.split("/")[-1].replace("PS", "") for port in ports]
+        """Convert ports to the suitable format, skipping duplicates."""
+        return list(
+            dict.fromkeys(port.rpartition("/")[2].removeprefix("PS") for port in ports)
+        )
 
     def set_outlets_state(self, ports: list[str], state: str) -> None:
         """Set Outlet/Outlets state.
@@ -33,5 +37,17 @@ class ServerTechOutletsStateFlow:
 
         outlets = ServerTechOutletsStateFlow._ports_to_outlet_ids(ports=ports)
 
-        for outlet_id in outlets:
-            self._si.set_outlet_state(outlet_id=outlet_id, outlet_state=state)
+        if not outlets:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_WORKERS, len(outlets))
+        ) as executor:
+            futures = [
+                executor.submit(
+                    self._si.set_outlet_state, outlet_id=outlet_id, outlet_state=state
+                )
+                for outlet_id in outlets
+            ]
+            for future in as_completed(futures):
+                future.result()
@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import logging
 import ssl
-import time
+import threading
 from abc import abstractmethod
+from collections import OrderedDict
 from collections.abc import Callable
 
+import orjson
 import requests
 import urllib3
-from attrs import define, field
-from attrs.setters import frozen
+from attrs import Factory, define, field
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from server_tech.helpers.errors import (
     BaseServerTechError,
@@ -19,23 +22,56 @@ from server_tech.helpers.errors import (
 
 logger = logging.getLogger(__name__)
 
-
-@define
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+_API_CACHE_SIZE = 32
+_API_CACHE: OrderedDict[tuple[str, int, str, str], ServerTechAPI] = OrderedDict()
+_API_CACHE_LOCK = threading.Lock()
+
+
+def _create_session(client: BaseAPIClient) -> requests.Session:
+    """Create HTTP session with pooled keep-alive connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        # retry busy/unavailable responses only, never re-send a
+        # control action after a connection or read failure
+        max_retries=Retry(
+            total=None,
+            connect=0,
+            read=0,
+            other=0,
+            status=6,
+            backoff_factor=0.5,
+            status_forcelist=[404, 503],
+            allowed_methods=["GET", "PATCH"],
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.verify = client.verify_ssl
+    if client.username:
+        session.auth = (client.username, client.password)
+    session.headers.update({"Content-Type": "application/json"})
+    return session
+
+
+@define(frozen=True)
 class BaseAPIClient:
-    address: str = field(on_setattr=frozen)
-    username: str = field(on_setattr=frozen)
-    password: str = field(on_setattr=frozen)
-    session: requests.Session = field(on_setattr=frozen, default=requests.Session())
-    scheme: str = field(on_setattr=frozen, default="https")
-    port: int = field(on_setattr=frozen, default=443)
-    verify_ssl: bool = field(on_setattr=frozen, default=ssl.CERT_NONE)
-
-    def __attrs_post_init__(self):
-        self.session.verify = self.verify_ssl
-        if self.username:
-            self.session.auth = (self.username, self.password)
-        self.session.headers.update({"Content-Type": "application/json"})
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    address: str
+    username: str
+    password: str
+    scheme: str = "https"
+    port: int = 443
+    verify_ssl: bool = ssl.CERT_NONE
+    session: requests.Session = Factory(_create_session, takes_self=True)
+    _cached_base_url: str = field(
+        init=False,
+        repr=False,
+        default=Factory(lambda self: self._base_url(), takes_self=True),
+    )
 
     @abstractmethod
     def _base_url(self):
@@ -52,7 +88,7 @@ class BaseAPIClient:
         if http_error_map is None:
             http_error_map = {}
 
-        url = f"{self._base_url()}/{path}"
+        url = f"{self._cached_base_url}/{path}"
         res = method(url=url, **kwargs)
         try:
             raise_for_status and res.raise_for_status()
@@ -124,7 +160,7 @@ class BaseAPIClient:
         )
 
 
-@define
+@define(frozen=True)
 class ServerTechAPI(BaseAPIClient):
     BASE_ERRORS = {
         404: RESTAPIUnavailableServerTechError,
@@ -137,91 +173,96 @@ class ServerTechAPI(BaseAPIClient):
     503 SERVICE UNAVAILABLE The server is too busy to send the resource or resource collection  # noqa E501
     """
 
-    class Decorators:
-        @classmethod
-        def get_data(
-            cls, retries: int = 6, timeout: int = 5, raise_on_timeout: bool = True
-        ):
-            def wrapper(decorated):
-                def inner(*args, **kwargs):
-                    exception = None
-                    attempt = 0
-                    while attempt < retries:
-                        try:
-                            response = decorated(*args, **kwargs)
-                            if response.text:
-                                return response.json()
-                            else:
-                                return response
-                        except RESTAPIUnavailableServerTechError as e:
-                            exception = e
-                            time.sleep(timeout)
-                            attempt += 1
-
-                    if raise_on_timeout:
-                        if exception:
-                            raise exception
-                        else:
-                            raise RESTAPIServerTechError(
-                                f"Cannot execute request for {retries * timeout} sec."
-                            )
-
-                return inner
-
-            return wrapper
+    _GET_ERRORS = dict(BASE_ERRORS)
+    _PATCH_ERRORS = {
+        **BASE_ERRORS,
+        400: RESTAPIServerTechError,
+        409: RESTAPIServerTechError,
+    }
+    """
+    400 BAD REQUEST Malformed patch document; a required patch object member is missing OR an unsupported operation was included.  # noqa E501
+    409 CONFLICT Property specified for updating does not exist in resource
+    """
 
     def _base_url(self):
         return f"{self.scheme}://{self.address}:{self.port}/jaws"
 
-    @Decorators.get_data()
-    def get_pdu_units_info(self) -> requests.Response:
+    @staticmethod
+    def _load_json(response: requests.Response) -> list | dict:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as caught_err:
+            logger.exception(f"Invalid JSON response: {caught_err}")
+            raise RESTAPIServerTechError(
+                f"Cannot parse response from {response.url}"
+            ) from caught_err
+
+    def get_pdu_units_info(self) -> list[dict]:
         """Get information about PDU units."""
-        error_map = {}
-
         units_data = self._do_get(
-            path="config/info/units", http_error_map={**self.BASE_ERRORS, **error_map}
+            path="config/info/units", http_error_map=self._GET_ERRORS
         )
 
-        return units_data
+        return self._load_json(units_data)
 
-    @Decorators.get_data()
-    def get_pdu_system_info(self) -> requests.Response:
+    def get_pdu_system_info(self) -> dict:
         """Get basic information about PDU."""
-        error_map = {}
-
         system_data = self._do_get(
-            path="config/info/system", http_error_map={**self.BASE_ERRORS, **error_map}
+            path="config/info/system", http_error_map=self._GET_ERRORS
         )
 
-        return system_data
+        return self._load_json(system_data)
 
-    @Decorators.get_data()
-    def get_outlets(self) -> requests.Response:
+    def get_outlets(self) -> list[dict]:
         """Get information about outlets."""
-        error_map = {}
-
         outlets_info = self._do_get(
-            path="control/outlets", http_error_map={**self.BASE_ERRORS, **error_map}
+            path="control/outlets", http_error_map=self._GET_ERRORS
         )
 
-        return outlets_info
+        return self._load_json(outlets_info)
 
-    @Decorators.get_data()
     def set_outlet_state(self, outlet_id: str, outlet_state: str) -> requests.Response:
         """Set outlet state.
 
         Possible outlet states could be on/off/reboot.
         """
-        error_map = {400: RESTAPIServerTechError, 409: RESTAPIServerTechError}
-        """
-        400 BAD REQUEST Malformed patch document; a required patch object member is missing OR an unsupported operation was included.  # noqa E501
-        409 CONFLICT Property specified for updating does not exist in resource
-        """
         return self._do_patch(
             path=f"control/outlets/{outlet_id}",
-            json={"control_action": outlet_state},
-            http_error_map={**self.BASE_ERRORS, **error_map},
+            data=orjson.dumps({"control_action": outlet_state}),
+            http_error_map=self._PATCH_ERRORS,
+        )
+
+
+def get_api(
+    address: str, port: int, scheme: str, username: str, password: str
+) -> ServerTechAPI:
+    """Get Server Technology API client cached by its configuration.
+
+    Clients are reused while their password stays the same, so repeated
+    driver commands share one session and its pooled connections. Sessions
+    of replaced or evicted clients are closed.
+    """
+    key = (address, port, scheme, username)
+    with _API_CACHE_LOCK:
+        api = _API_CACHE.get(key)
+        if api is not None and api.password == password:
+            _API_CACHE.move_to_end(key)
+            return api
+
+        if api is not None:
+            api.session.close()
+        api = ServerTechAPI(
+            address=address,
+            username=username,
+            password=password,
+            port=port,
+            scheme=scheme,
         )
+        _API_CACHE[key] = api
+        if len(_API_CACHE) > _API_CACHE_SIZE:
+            _, evicted = _API_CACHE.popitem(last=False)
+            evicted.session.close()
+        return api
 
 
 """
@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from attrs import define
 from cloudshell.shell.standards.pdu.resource_config import RESTAPIPDUResourceConfig
 
-from server_tech.handlers.rest_api_handler import ServerTechAPI
+from server_tech.handlers.rest_api_handler import ServerTechAPI, get_api
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -27,42 +27,40 @@ class ServerTechHandler:
     @classmethod
     def from_config(cls, conf: RESTAPIPDUResourceConfig) -> ServerTechHandler:
         logger.info("Initializing Server Technology API client.")
-        api = ServerTechAPI(
+        api = get_api(
             address=conf.address,
-            username=conf.api_user,
-            password=conf.api_password,
             port=conf.api_port or None,
             scheme=conf.api_scheme or None,
+            username=conf.api_user,
+            password=conf.api_password,
         )
         return cls(api)
 
-    def get_pdu_info(self):
-        """Get basic information about PDU."""
-        pdu_info = {}
+    def get_pdu_units_info(self) -> list[dict]:
+        """Get information about PDU units."""
+        return self._obj.get_pdu_units_info()
 
-        units_info = self._obj.get_pdu_units_info()
-        for unit in units_info:
-            pdu_info.update(
-                {
-                    "model": unit.get("model_number", ""),
-                    "serial": unit.get("product_serial_number", ""),
-                }
-            )
+    def get_pdu_system_info(self) -> dict:
+        """Get basic information about PDU system."""
+        return self._obj.get_pdu_system_info()
 
-        system_data = self._obj.get_pdu_system_info()
-        pdu_info.update({"fw": system_data.get("firmware", "")})
+    @staticmethod
+    def get_pdu_info(units_info: list[dict], system_data: dict) -> dict:
+        """Get basic information about PDU from units and system info."""
+        # model and serial are taken from the last reported unit
+        unit = units_info[-1] if units_info else {}
 
-        return pdu_info
+        return {
+            "model": unit.get("model_number", ""),
+            "serial": unit.get("product_serial_number", ""),
+            "fw": system_data.get("firmware", ""),
+        }
 
     def get_outlets_info(self):
         """Get information about outlets."""
-        outlets_info = {}
-
         outlets = self._obj.get_outlets()
-        for outlet in outlets:
-            outlets_info.update({outlet["id"]: outlet["control_state"]})
 
-        return outlets_info
+        return {outlet["id"]: outlet["control_state"] for outlet in outlets}
 
     def set_outlet_state(self, outlet_id: str, outlet_state: str):
         """Set outlet state."""